@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import functools
 import json
 import logging
 import os
@@ -22,6 +23,16 @@ from .env_check import run_environment_check
 from .pipeline import TranscriptionPipeline
 from .setup_wizard import run_setup_wizard
 
+# The platform never changes within a process; resolve it once at import time.
+_SYSTEM: str = platform.system().lower()
+
+
+@functools.cache
+def _stdin_is_tty() -> bool:
+    """Return whether stdin is attached to a terminal (cached per process)."""
+
+    return bool(sys.stdin) and sys.stdin.isatty()
+
 
 def configure_logging(level: str) -> None:
     logging.basicConfig(
@@ -97,35 +108,35 @@ def _restore_linux_defaults(defaults: Optional[tuple[Optional[str], Optional[str
 
 def _list_linux_devices(kind: str) -> List[str]:
     assert kind in {"sinks", "sources"}
+    names: List[str] = []
     try:
-        output = subprocess.check_output(
-            ["pactl", "list", "short", kind], text=True, stderr=subprocess.DEVNULL
-        )
+        with subprocess.Popen(
+            ["pactl", "list", "short", kind],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ) as proc:
+            # Stream line by line instead of buffering the whole output.
+            for line in proc.stdout:
+                parts = line.split("\t")
+                if len(parts) >= 2:
+                    names.append(parts[1].strip())
     except Exception:  # noqa: BLE001
         return []
-    names: List[str] = []
-    for line in output.splitlines():
-        parts = line.split("\t")
-        if len(parts) >= 2:
-            names.append(parts[1].strip())
     return names
 
 
-def _ensure_linux_physical_defaults() -> None:
-    try:
-        info = subprocess.check_output(
-            ["pactl", "info"], text=True, stderr=subprocess.DEVNULL
-        )
-    except Exception:  # noqa: BLE001
+def _ensure_linux_physical_defaults(
+    defaults: Optional[tuple[Optional[str], Optional[str]]] = None,
+) -> None:
+    # Callers that already ran _capture_linux_defaults can pass its result
+    # to avoid forking a redundant `pactl info`.
+    if defaults is None:
+        defaults = _capture_linux_defaults()
+    if defaults is None:
         return
 
-    current_sink: Optional[str] = None
-    current_source: Optional[str] = None
-    for line in info.splitlines():
-        if line.startswith("Default Sink:"):
-            current_sink = line.split(":", 1)[1].strip() or None
-        elif line.startswith("Default Source:"):
-            current_source = line.split(":", 1)[1].strip() or None
+    current_sink, current_source = defaults
 
     sinks = _list_linux_devices("sinks")
     sources = _list_linux_devices("sources")
@@ -150,23 +161,23 @@ def _ensure_linux_physical_defaults() -> None:
 def _snapshot_linux_modules() -> Dict[str, Set[str]]:
     result: Dict[str, Set[str]] = {"null": set(), "loop": set()}
     try:
-        output = subprocess.check_output(
+        with subprocess.Popen(
             ["pactl", "list", "short", "modules"],
-            text=True,
+            stdout=subprocess.PIPE,
             stderr=subprocess.DEVNULL,
-        )
+            text=True,
+        ) as proc:
+            for line in proc.stdout:
+                parts = line.split("\t")
+                if len(parts) < 2:
+                    continue
+                idx, name = parts[0].strip(), parts[1].strip()
+                if name == "module-null-sink":
+                    result["null"].add(idx)
+                elif name == "module-loopback":
+                    result["loop"].add(idx)
     except Exception:  # noqa: BLE001
         return result
-
-    for line in output.splitlines():
-        parts = line.split("\t")
-        if len(parts) < 2:
-            continue
-        idx, name = parts[0].strip(), parts[1].strip()
-        if name == "module-null-sink":
-            result["null"].add(idx)
-        elif name == "module-loopback":
-            result["loop"].add(idx)
     return result
 
 
@@ -196,7 +207,7 @@ def run_easy_start(
         print(f"Audio diagnostic error: {exc}")
         return False
 
-    system = platform.system().lower()
+    system = _SYSTEM
     scripts_dir = Path(__file__).resolve().parent.parent / "scripts"
     if system != "windows":
         print("The easy-start helper currently supports Windows only.")
@@ -212,8 +223,7 @@ def run_easy_start(
         str(script_path),
     ]
 
-    stdin_is_tty = sys.stdin.isatty() if sys.stdin else False
-    if interactive and not stdin_is_tty:
+    if interactive and not _stdin_is_tty():
         logging.debug("Standard input is not a TTY; running easy-start in non-interactive mode.")
         interactive = False
 
@@ -269,11 +279,13 @@ async def run_pipeline(
     )
 
     loop = asyncio.get_running_loop()
-    stop_event = asyncio.Event()
+    # A bare Future is lighter than asyncio.Event for a one-shot stop signal.
+    stop_future = loop.create_future()
 
     def handle_stop(*_args):
         logging.info("Received stop signal, shutting down.")
-        stop_event.set()
+        if not stop_future.done():
+            stop_future.set_result(None)
 
     def handle_suspend(*_args):
         logging.warning(
@@ -298,7 +310,7 @@ async def run_pipeline(
         register_signal(signal.SIGTSTP, handle_suspend, "SIGTSTP")
 
     run_task = asyncio.create_task(pipeline.run())
-    await stop_event.wait()
+    await stop_future
     run_task.cancel()
     try:
         await run_task
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import time
 from typing import Dict, List, Optional
 
 from .notifier import DiscordNotifier
@@ -27,51 +28,109 @@ class DiscordBatcher:
     ) -> None:
         self._notifier = notifier
         self._flush_interval = flush_interval
+        # Upper bound on how long an entry may sit in the buffer while new
+        # entries keep postponing the flush.
+        self._max_latency = flush_interval * 3
         self._max_chars = max_chars
+        self._last_add_monotonic = 0.0
+        self._first_pending_monotonic = 0.0
         self._buffer: List[str] = []
-        self._timer_task: Optional[asyncio.Task] = None
+        self._buffer_len = 0
+        self._worker_task: Optional[asyncio.Task] = None
+        self._wake = asyncio.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closing = False
         self._lock = asyncio.Lock()
+        # Pre-rendered "label: " prefixes; unknown codes are added lazily so
+        # repeated entries skip the dict.get + upper() per language.
+        self._label_prefix: Dict[str, str] = {
+            code: f"{label}: " for code, label in LANG_LABELS.items()
+        }
 
     async def add_entry(self, text: str, translations: Dict[str, str]) -> None:
         if not self._notifier.enabled:
             return
+        # Formatting and timer scheduling need no mutual exclusion; only the
+        # size check, overflow flush, and append touch shared state.
         entry = self._format_message(text, translations)
         async with self._lock:
-            if len("\n\n".join(self._buffer + [entry])) > self._max_chars:
-                await self._flush_locked()
+            # Track the joined length incrementally instead of re-joining the
+            # whole buffer on every add (O(total chars) per entry otherwise).
+            projected = self._buffer_len + (2 if self._buffer else 0) + len(entry)
+            overflow: Optional[str] = None
+            if projected > self._max_chars:
+                overflow = self._drain_locked()
+            now = time.monotonic()
+            if not self._buffer:
+                self._first_pending_monotonic = now
+            self._last_add_monotonic = now
+            self._buffer_len += (2 if self._buffer else 0) + len(entry)
             self._buffer.append(entry)
-            self._schedule_flush()
+        if overflow:
+            await self._notifier.send(overflow)
+        self._schedule_flush()
 
     def _format_message(self, text: str, translations: Dict[str, str]) -> str:
+        prefixes = self._label_prefix
         parts = [f"Esperanto: {text}"]
         for lang_code, translated in translations.items():
-            label = LANG_LABELS.get(lang_code, lang_code.upper())
-            parts.append(f"{label}: {translated}")
+            prefix = prefixes.get(lang_code)
+            if prefix is None:
+                prefix = prefixes.setdefault(lang_code, f"{lang_code.upper()}: ")
+            parts.append(prefix + translated)
         return "\n".join(parts)
 
     def _schedule_flush(self) -> None:
-        if self._timer_task and not self._timer_task.done():
-            return
-        loop = asyncio.get_running_loop()
-        self._timer_task = loop.create_task(self._delayed_flush())
+        # One long-lived worker instead of a fresh Task per batch; producers
+        # only pay an Event.set() here.
+        if self._worker_task is None or self._worker_task.done():
+            if self._loop is None:
+                self._loop = asyncio.get_running_loop()
+            self._worker_task = self._loop.create_task(self._flush_worker())
+        self._wake.set()
 
-    async def _delayed_flush(self) -> None:
-        await asyncio.sleep(self._flush_interval)
-        async with self._lock:
-            await self._flush_locked()
+    async def _flush_worker(self) -> None:
+        while not self._closing:
+            await self._wake.wait()
+            self._wake.clear()
+            # Debounce: flush once no entry has arrived for a full interval,
+            # but never keep the first entry waiting beyond _max_latency.
+            delay = self._flush_interval
+            message: Optional[str] = None
+            while True:
+                await asyncio.sleep(delay)
+                async with self._lock:
+                    if not self._buffer:
+                        break
+                    now = time.monotonic()
+                    quiet = now - self._last_add_monotonic
+                    waited = now - self._first_pending_monotonic
+                    if quiet >= self._flush_interval or waited >= self._max_latency:
+                        message = self._drain_locked()
+                        break
+                    delay = min(self._flush_interval - quiet, self._max_latency - waited)
+            # POST outside the lock so a slow Discord RTT never stalls
+            # producers appending new entries.
+            if message:
+                await self._notifier.send(message)
 
-    async def _flush_locked(self) -> None:
+    def _drain_locked(self) -> Optional[str]:
         if not self._buffer:
-            return
+            return None
         message = "\n\n".join(self._buffer)
         self._buffer.clear()
-        await self._notifier.send(message)
+        self._buffer_len = 0
+        return message
 
     async def close(self) -> None:
-        if self._timer_task:
-            self._timer_task.cancel()
+        self._closing = True
+        if self._worker_task:
+            self._wake.set()
+            self._worker_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
-                await self._timer_task
-            self._timer_task = None
+                await self._worker_task
+            self._worker_task = None
         async with self._lock:
-            await self._flush_locked()
+            message = self._drain_locked()
+        if message:
+            await self._notifier.send(message)
@@ -12,39 +12,69 @@ import aiohttp
 class DiscordNotifier:
     """Post final transcripts to a Discord channel using a webhook."""
 
-    def __init__(self, webhook_url: Optional[str], username: str = "Esperanto STT", enabled: bool = False) -> None:
+    def __init__(
+        self,
+        webhook_url: Optional[str],
+        username: str = "Esperanto STT",
+        enabled: bool = False,
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> None:
         self.webhook_url = webhook_url
         self.username = username
         self.enabled = enabled and bool(webhook_url)
-        self._session: Optional[aiohttp.ClientSession] = None
+        # An injected session is shared application-wide; we only own (and
+        # close) sessions we created ourselves.
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
         self._lock = asyncio.Lock()
 
     async def _ensure_session(self) -> Optional[aiohttp.ClientSession]:
         if not self.enabled:
             return None
-        if self._session is None or self._session.closed:
-            timeout = aiohttp.ClientTimeout(total=10)
-            self._session = aiohttp.ClientSession(timeout=timeout)
-        return self._session
+        session = self._session
+        if session is not None and not session.closed:
+            return session
+        # The lock only guards lazy construction; double-check inside.
+        async with self._lock:
+            if self._session is None or self._session.closed:
+                timeout = aiohttp.ClientTimeout(total=10)
+                # Keep-alive plus DNS caching lets flushes a few seconds apart
+                # reuse the webhook host's TLS connection instead of paying a
+                # fresh lookup and handshake per POST.
+                connector = aiohttp.TCPConnector(
+                    limit=8,
+                    limit_per_host=4,
+                    ttl_dns_cache=600,
+                    keepalive_timeout=75,
+                    enable_cleanup_closed=True,
+                )
+                self._session = aiohttp.ClientSession(timeout=timeout, connector=connector)
+                self._owns_session = True
+            return self._session
 
     async def close(self) -> None:
         if self._session:
-            await self._session.close()
+            if self._owns_session:
+                await self._session.close()
             self._session = None
 
     async def send(self, text: str) -> None:
-        if not self.enabled or not text.strip():
+        if not self.enabled:
             return
-        async with self._lock:
-            session = await self._ensure_session()
-            if not session:
-                return
-            try:
-                payload = {"content": text.strip(), "username": self.username}
-                async with session.post(self.webhook_url, json=payload) as resp:
-                    if resp.status >= 300:
-                        body = await resp.text()
-                        logging.error("Discord webhook failed (%s): %s", resp.status, body)
-            except Exception as exc:  # noqa: BLE001
-                logging.exception("Failed to post to Discord webhook: %s", exc)
+        content = text.strip()
+        if not content:
+            return
+        session = await self._ensure_session()
+        if not session:
+            return
+        # ClientSession is safe for concurrent use; post outside the lock so
+        # producers are bounded by the connection pool, not serialised here.
+        try:
+            payload = {"content": content, "username": self.username}
+            async with session.post(self.webhook_url, json=payload) as resp:
+                if resp.status >= 300:
+                    body = await resp.text()
+                    logging.error("Discord webhook failed (%s): %s", resp.status, body)
+        except Exception as exc:  # noqa: BLE001
+            logging.exception("Failed to post to Discord webhook: %s", exc)
 
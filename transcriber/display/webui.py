@@ -9,6 +9,19 @@ from typing import Dict, List, Optional, Set
 
 from aiohttp import web, WSMsgType
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _encode_payload(payload: dict) -> bytes:
+    """Serialise a broadcast payload to UTF-8 JSON bytes."""
+
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
 
 class CaptionWebUI:
     """Lightweight Web UI for live captions via WebSocket.
@@ -35,6 +48,7 @@ class CaptionWebUI:
         self._runner: Optional[web.AppRunner] = None
         self._site: Optional[web.TCPSite] = None
         self._clients: Set[web.WebSocketResponse] = set()
+        self._send_buffer: List = []
         self._task: Optional[asyncio.Task] = None
         self._config_payload = {
             "targets": list(translation_targets or []),
@@ -117,7 +131,26 @@ class CaptionWebUI:
     async def broadcast(self, payload: dict) -> None:
         if not self._clients:
             return
-        data = json.dumps(payload)
-        coros = [ws.send_str(data) for ws in list(self._clients) if not ws.closed]
-        if coros:
-            await asyncio.gather(*coros, return_exceptions=True)
+        # Encode once; send_bytes ships the same UTF-8 buffer to every client
+        # instead of re-encoding the payload per connection.
+        await self.broadcast_bytes(_encode_payload(payload))
+
+    async def broadcast_bytes(self, data: bytes) -> None:
+        """Fan out a pre-serialized JSON frame, skipping the encode step."""
+
+        if not self._clients:
+            return
+        # _clients only holds open sockets (_handle_ws discards on exit), so
+        # no closed-state scan is needed here; a failed send evicts directly.
+        targets = tuple(self._clients)
+        # Reuse one list across broadcasts to avoid churning allocations at
+        # partial-result frequency; overlapping broadcasts get a private one.
+        coros = self._send_buffer if not self._send_buffer else []
+        coros.extend(ws.send_bytes(data) for ws in targets)
+        try:
+            results = await asyncio.gather(*coros, return_exceptions=True)
+        finally:
+            coros.clear()
+        for ws, result in zip(targets, results):
+            if isinstance(result, Exception):
+                self._clients.discard(ws)
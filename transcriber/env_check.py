@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import importlib.util
+import io
+import os
 import platform
+import re
 import sys
+from contextlib import redirect_stdout
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, List, Set, Tuple
 
 REQUIRED_PACKAGES: Dict[str, str] = {
     "aiohttp": "aiohttp",
@@ -32,6 +36,9 @@ CRITICAL_FILES = [
 
 DEFAULT_GOOGLE_CREDENTIAL = "gen-lang-client-0219123936-d6e117f5a590.json"
 
+# KEY=value lines; comments and blanks simply fail to match.
+_ENV_LINE_RE = re.compile(rb"^\s*([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*?)\s*$")
+
 
 def _print_section(title: str) -> None:
     print("\n" + "=" * 60)
@@ -39,11 +46,34 @@ def _print_section(title: str) -> None:
     print("=" * 60)
 
 
+def _scan_top_level_modules() -> Set[str]:
+    """Collect importable top-level names with one scandir pass over sys.path."""
+
+    names: Set[str] = set()
+    for entry in sys.path:
+        try:
+            with os.scandir(entry or ".") as iterator:
+                for item in iterator:
+                    name = item.name
+                    if name.endswith((".py", ".pyc", ".pyd", ".so")):
+                        names.add(name.partition(".")[0])
+                    elif item.is_dir():
+                        names.add(name)
+        except OSError:
+            continue
+    return names
+
+
 def _check_packages() -> Tuple[List[str], List[str]]:
     missing: List[str] = []
     installed: List[str] = []
+    # One directory walk answers most lookups; find_spec (which re-stats
+    # sys.path per call) remains the fallback for dotted/namespace modules.
+    top_level = _scan_top_level_modules()
     for pretty, module_name in REQUIRED_PACKAGES.items():
-        if importlib.util.find_spec(module_name) is None:
+        if "." not in module_name and module_name in top_level:
+            installed.append(pretty)
+        elif importlib.util.find_spec(module_name) is None:
             missing.append(pretty)
         else:
             installed.append(pretty)
@@ -53,15 +83,15 @@ def _check_packages() -> Tuple[List[str], List[str]]:
 def _read_env_pairs(env_path: Path) -> Dict[str, str]:
     pairs: Dict[str, str] = {}
     try:
-        with env_path.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                stripped = line.strip()
-                if not stripped or stripped.startswith("#") or "=" not in stripped:
-                    continue
-                key, value = stripped.split("=", 1)
-                pairs[key.strip()] = value.strip().strip('"')
+        raw = env_path.read_bytes()
     except FileNotFoundError:
-        pass
+        return pairs
+    for line in raw.split(b"\n"):
+        match = _ENV_LINE_RE.match(line)
+        if not match:
+            continue
+        key, value = match.groups()
+        pairs[key.decode("utf-8")] = value.decode("utf-8").strip('"')
     return pairs
 
 
@@ -75,10 +105,22 @@ def _section_packages(installed: Iterable[str], missing: Iterable[str]) -> None:
 
 def _section_files() -> List[str]:
     _print_section("4. Required files")
+    # One scandir per parent directory instead of a stat per file.
+    by_parent: Dict[Path, List[str]] = {}
+    for rel in CRITICAL_FILES:
+        by_parent.setdefault(Path(rel).parent, []).append(rel)
+    present: Set[str] = set()
+    for parent, rels in by_parent.items():
+        try:
+            with os.scandir(parent) as iterator:
+                names = {entry.name for entry in iterator}
+        except OSError:
+            continue
+        present.update(rel for rel in rels if Path(rel).name in names)
+
     missing: List[str] = []
     for rel in CRITICAL_FILES:
-        path = Path(rel)
-        if path.exists():
+        if rel in present:
             print(f"  [OK] {rel}")
         else:
             print(f"  [!!] {rel}")
@@ -166,9 +208,24 @@ def _print_os_guidance() -> None:
         print("  - This toolkit currently targets Windows. Review the README for manual setup steps on other platforms.")
 
 
-def run_environment_check() -> bool:
-    """Run environment diagnostics; returns True when ready to run."""
+def run_environment_check(verbose: bool = True) -> bool:
+    """Run environment diagnostics; returns True when ready to run.
+
+    With ``verbose=False`` the checks still run but the report is discarded,
+    for callers that only gate on the boolean result.
+    """
+
+    # Buffer the whole report and emit it with a single write; per-line
+    # print() flushes are noticeably slow on Windows consoles.
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        ready = _run_environment_check()
+    if verbose:
+        sys.stdout.write(buffer.getvalue())
+    return ready
+
 
+def _run_environment_check() -> bool:
     _print_section("Environment readiness check")
     print(f"Platform : {platform.platform()}")
     print(f"Python   : {sys.version}")
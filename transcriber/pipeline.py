@@ -3,14 +3,15 @@
 from __future__ import annotations
 
 import asyncio
-import functools
+import contextlib
 import logging
 import os
 import re
 import sys
+import threading
+import time
 import webbrowser
 from dataclasses import dataclass, field
-from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -27,21 +28,34 @@ from .asr import (
 from .audio import AudioCaptureError, AudioChunkStream
 from .config import BackendChoice, Settings, load_settings
 from .zoom_caption import ZoomCaptionPublisher
-from .display.webui import CaptionWebUI
+from .display.webui import CaptionWebUI, _encode_payload
 from .discord import DiscordBatcher, DiscordNotifier
 from .translate import TranslationService
 
 
+# Compiled once; _normalize_text runs per ASR partial/final result.
+_WS_RE = re.compile(r"\s+")
+_PUNCT_RE = re.compile(r"\s+([,.;:?!])")
+_OPEN_RE = re.compile(r"([\(\[\{])\s+")
+_CLOSE_RE = re.compile(r"\s+([\)\]\}])")
+
+_SENTENCE_TERMINATORS = frozenset(".?!")
+
+# The "clear partial" frame is constant; serialize it once at import.
+_EMPTY_PARTIAL_PAYLOAD = {"type": "partial", "text": "", "speaker": None}
+_EMPTY_PARTIAL_BYTES = _encode_payload(_EMPTY_PARTIAL_PAYLOAD)
+
+
 def _normalize_text(text: str) -> str:
     if not text:
         return ""
     stripped = text.strip()
     if not stripped:
         return ""
-    normalized = re.sub(r"\s+", " ", stripped)
-    normalized = re.sub(r"\s+([,.;:?!])", r"\1", normalized)
-    normalized = re.sub(r"([\(\[\{])\s+", r"\1", normalized)
-    normalized = re.sub(r"\s+([\)\]\}])", r"\1", normalized)
+    normalized = _WS_RE.sub(" ", stripped)
+    normalized = _PUNCT_RE.sub(r"\1", normalized)
+    normalized = _OPEN_RE.sub(r"\1", normalized)
+    normalized = _CLOSE_RE.sub(r"\1", normalized)
     return normalized
 
 
@@ -68,7 +82,11 @@ class SentenceAssembler:
     """Accumulate short fragments into sentence-sized chunks."""
 
     def __init__(self, max_length: int = 120) -> None:
-        self._buffer: str = ""
+        # Fragments are kept as a list and joined only when a sentence is
+        # emitted; concatenating into one string would reallocate the whole
+        # buffer on every ASR result.
+        self._parts: List[str] = []
+        self._total_len = 0
         self._max_length = max_length
 
     def feed(self, fragment: str) -> List[str]:
@@ -76,26 +94,26 @@ class SentenceAssembler:
         if not fragment:
             return []
 
-        if self._buffer:
-            self._buffer = f"{self._buffer} {fragment}".strip()
-        else:
-            self._buffer = fragment
+        self._total_len += len(fragment) + (1 if self._parts else 0)
+        self._parts.append(fragment)
 
-        sentences: List[str] = []
-        if self._buffer and (self._buffer[-1] in ".?!" or len(self._buffer) >= self._max_length):
-            sentences.append(self._buffer)
-            self._buffer = ""
-        return sentences
+        if fragment[-1] in _SENTENCE_TERMINATORS or self._total_len >= self._max_length:
+            sentence = " ".join(self._parts)
+            self._parts.clear()
+            self._total_len = 0
+            return [sentence]
+        return []
 
     @property
     def pending(self) -> str:
-        return self._buffer
+        return " ".join(self._parts)
 
     def flush(self) -> List[str]:
-        if not self._buffer:
+        if not self._parts:
             return []
-        pending = self._buffer
-        self._buffer = ""
+        pending = " ".join(self._parts)
+        self._parts.clear()
+        self._total_len = 0
         return [pending]
 
 
@@ -106,6 +124,10 @@ class TranscriptFileLogger:
         self._settings = settings
         self._override_path = override_path
         self._file = None
+        # Timestamps have one-second resolution; cache the formatted string
+        # so bursts of lines within the same second skip strftime.
+        self._last_ts_sec = 0
+        self._last_ts = ""
 
     @property
     def _resolved_path(self) -> Optional[Path]:
@@ -123,7 +145,9 @@ class TranscriptFileLogger:
 
         path.parent.mkdir(parents=True, exist_ok=True)
         mode = "w" if self._settings.overwrite else "a"
-        self._file = path.open(mode=mode, encoding="utf-8")
+        # Line buffering: each newline still reaches the OS promptly without
+        # an explicit flush() call per transcript line.
+        self._file = path.open(mode=mode, encoding="utf-8", buffering=1)
         logging.info("Transcript logging to %s (mode=%s)", path, mode)
         return self
 
@@ -138,10 +162,15 @@ class TranscriptFileLogger:
 
         line = text
         if self._settings.include_timestamps:
-            timestamp = datetime.now().isoformat(timespec="seconds")
-            line = f"[{timestamp}] {text}"
-        self._file.write(line + "\n")
-        self._file.flush()
+            now_sec = int(time.time())
+            if now_sec != self._last_ts_sec:
+                self._last_ts_sec = now_sec
+                self._last_ts = time.strftime(
+                    "%Y-%m-%dT%H:%M:%S", time.localtime(now_sec)
+                )
+            line = f"[{self._last_ts}] {text}"
+        self._file.write(line)
+        self._file.write("\n")
 
 
 class TranscriptionPipeline:
@@ -168,6 +197,14 @@ class TranscriptionPipeline:
             self.settings.logging, override_path=transcript_log_override
         )
         self._web_ui: Optional[CaptionWebUI] = None
+        # Last partial pushed to the WebUI; VOSK re-emits identical partials
+        # many times a second and each broadcast costs an encode + N sends.
+        self._last_partial_text: Optional[str] = None
+        self._last_partial_speaker: Optional[str] = None
+        # Partials are coalesced: only the newest payload survives until the
+        # flush task ships it, capping broadcasts at ~10 Hz.
+        self._pending_partial: Optional[dict] = None
+        self._partial_flush_task: Optional[asyncio.Task] = None
         self.state = PipelineState()
         self._running = False
         self._sentence_assembler = SentenceAssembler()
@@ -213,6 +250,9 @@ class TranscriptionPipeline:
         backend = self._create_backend()
         try:
             with self._transcript_logger:
+                # Open the translation session now so the first sentence does
+                # not pay connection setup on top of the provider round trip.
+                await self._translation_service.warmup()
                 async with self._zoom_publisher:
                     if self.settings.web.enabled:
                         self._web_ui = CaptionWebUI(
@@ -239,10 +279,16 @@ class TranscriptionPipeline:
                                     if sys.platform.startswith("win"):
                                         os.startfile(url)  # type: ignore[attr-defined]
                                     else:
-                                        loop = asyncio.get_running_loop()
-                                        await loop.run_in_executor(
-                                            None, functools.partial(webbrowser.open, url, new=1)
-                                        )
+                                        # A throwaway daemon thread keeps the
+                                        # potentially slow webbrowser.open off
+                                        # the loop without tying up an
+                                        # executor worker.
+                                        threading.Thread(
+                                            target=webbrowser.open,
+                                            args=(url,),
+                                            kwargs={"new": 1},
+                                            daemon=True,
+                                        ).start()
                                 except Exception as exc:  # noqa: BLE001
                                     logging.warning("Failed to open browser automatically: %s", exc)
                     async with self._audio_stream.connect() as audio_stream:
@@ -261,6 +307,7 @@ class TranscriptionPipeline:
                 await self._flush_pending_sentences()
             except Exception as exc:  # noqa: BLE001
                 logging.exception("Failed to flush pending sentences: %s", exc)
+            await self._stop_partial_flush()
             if self._web_ui:
                 await self._web_ui.stop()
                 self._web_ui = None
@@ -273,50 +320,83 @@ class TranscriptionPipeline:
     async def _main_loop(
         self, audio_stream: AudioChunkStream, backend: StreamingTranscriptionBackend
     ) -> None:
-        audio_task = asyncio.create_task(
-            self._pump_audio(audio_stream, backend), name="audio-producer"
-        )
-        transcript_task = asyncio.create_task(
-            self._consume_transcripts(backend), name="transcript-consumer"
-        )
+        # TaskGroup cancels the sibling and propagates the error when either
+        # task fails, replacing the manual wait/cancel/result dance.
+        try:
+            async with asyncio.TaskGroup() as group:
+                group.create_task(
+                    self._pump_audio(audio_stream, backend), name="audio-producer"
+                )
+                group.create_task(
+                    self._consume_transcripts(backend), name="transcript-consumer"
+                )
+        except ExceptionGroup as group_exc:
+            # The sibling is cancelled on failure, so the group normally holds
+            # one exception; unwrap it for run()'s typed handlers.
+            if len(group_exc.exceptions) == 1:
+                raise group_exc.exceptions[0] from None
+            raise
 
-        done, pending = await asyncio.wait(
-            {audio_task, transcript_task},
-            return_when=asyncio.FIRST_EXCEPTION,
+    def _create_speechmatics_backend(self) -> StreamingTranscriptionBackend:
+        if not self.settings.speechmatics:
+            raise RuntimeError("Speechmatics configuration missing.")
+        return SpeechmaticsRealtimeBackend(self.settings.speechmatics)
+
+    def _create_vosk_backend(self) -> StreamingTranscriptionBackend:
+        if not self.settings.vosk:
+            raise RuntimeError("Vosk configuration missing.")
+        return VoskStreamingBackend(self.settings.vosk)
+
+    def _create_whisper_backend(self) -> StreamingTranscriptionBackend:
+        if not self.settings.whisper:
+            raise RuntimeError("Whisper configuration missing.")
+        return WhisperStreamingBackend(
+            self.settings.whisper, self.settings.audio.sample_rate
         )
-        for task in pending:
-            task.cancel()
-        for task in done:
-            task.result()
 
-    def _create_backend(self) -> StreamingTranscriptionBackend:
-        if self.backend_choice is BackendChoice.SPEECHMATICS:
-            if not self.settings.speechmatics:
-                raise RuntimeError("Speechmatics configuration missing.")
-            return SpeechmaticsRealtimeBackend(self.settings.speechmatics)
-
-        if self.backend_choice is BackendChoice.VOSK:
-            if not self.settings.vosk:
-                raise RuntimeError("Vosk configuration missing.")
-            return VoskStreamingBackend(self.settings.vosk)
-
-        if self.backend_choice is BackendChoice.WHISPER:
-            if not self.settings.whisper:
-                raise RuntimeError("Whisper configuration missing.")
-            return WhisperStreamingBackend(
-                self.settings.whisper, self.settings.audio.sample_rate
-            )
+    _BACKEND_FACTORIES = {
+        BackendChoice.SPEECHMATICS: _create_speechmatics_backend,
+        BackendChoice.VOSK: _create_vosk_backend,
+        BackendChoice.WHISPER: _create_whisper_backend,
+    }
 
-        raise RuntimeError(f"Unsupported backend: {self.backend_choice}")
+    def _create_backend(self) -> StreamingTranscriptionBackend:
+        factory = self._BACKEND_FACTORIES.get(self.backend_choice)
+        if factory is None:
+            raise RuntimeError(f"Unsupported backend: {self.backend_choice}")
+        return factory(self)
 
     async def _emit_sentence(self, sentence: str, speaker: Optional[str]) -> None:
         sentence = sentence.strip()
         if not sentence:
             return
 
-        translations: Dict[str, str] = {}
-        translation_result = await self._translation_service.translate(sentence)
-        translations = translation_result.translations
+        # Start the translation round trip first, then do the local work
+        # (log, file, WebUI, Zoom) while it is in flight instead of blocking
+        # everything on the translator's RTT.
+        translate_task: Optional[asyncio.Task] = None
+        streamed: Dict[str, str] = {}
+
+        async def on_partial_translation(target: str, translated: str) -> None:
+            # Push each target as soon as its provider answers; perceived
+            # latency tracks the fastest target instead of the slowest.
+            streamed[target] = translated
+            if self._web_ui:
+                await self._web_ui.broadcast(
+                    {
+                        "type": "translation_update",
+                        "text": sentence,
+                        "speaker": speaker,
+                        "translations": dict(streamed),
+                    }
+                )
+
+        if self._translation_service.enabled:
+            translate_task = asyncio.create_task(
+                self._translation_service.translate(
+                    sentence, on_partial=on_partial_translation
+                )
+            )
 
         logging.info("Final: %s", sentence)
         self._transcript_logger.log_final(sentence)
@@ -326,27 +406,82 @@ class TranscriptionPipeline:
                     "type": "final",
                     "text": sentence,
                     "speaker": speaker,
-                    "translations": translations,
+                    "translations": {},
                 }
             )
-        await self._discord_batcher.add_entry(sentence, translations)
 
         zoom_payload = self.state.add_result(sentence, True)
         if zoom_payload:
             await self._zoom_publisher.post_caption(zoom_payload)
 
+        translations: Dict[str, str] = {}
+        if translate_task is not None:
+            translations = (await translate_task).translations
+            # Cache hits skip the per-target callbacks; broadcast once here.
+            if translations and not streamed and self._web_ui:
+                await self._web_ui.broadcast(
+                    {
+                        "type": "translation_update",
+                        "text": sentence,
+                        "speaker": speaker,
+                        "translations": translations,
+                    }
+                )
+        await self._discord_batcher.add_entry(sentence, translations)
+
     async def _flush_pending_sentences(self) -> None:
         pending_sentences = self._sentence_assembler.flush()
         for sentence in pending_sentences:
             await self._emit_sentence(sentence, speaker=None)
-        if self._web_ui:
-            await self._web_ui.broadcast(
-                {
-                    "type": "partial",
-                    "text": "",
-                    "speaker": None,
-                }
-            )
+        if self._web_ui and (self._last_partial_text, self._last_partial_speaker) != (
+            "",
+            None,
+        ):
+            # Drop any coalesced partial still in flight; the clear frame
+            # must be the last partial the clients see.
+            self._pending_partial = None
+            self._last_partial_text = ""
+            self._last_partial_speaker = None
+            await self._web_ui.broadcast_bytes(_EMPTY_PARTIAL_BYTES)
+
+    # 100 ms is roughly one video frame: imperceptible on a caption board but
+    # an order of magnitude fewer broadcasts with fast ASR backends.
+    _PARTIAL_FLUSH_INTERVAL = 0.1
+
+    async def _broadcast_partial(self, text: str, speaker: Optional[str]) -> None:
+        if (text, speaker) == (self._last_partial_text, self._last_partial_speaker):
+            return
+        self._last_partial_text = text
+        self._last_partial_speaker = speaker
+        self._pending_partial = {
+            "type": "partial",
+            "text": text,
+            "speaker": speaker,
+        }
+        if self._partial_flush_task is None or self._partial_flush_task.done():
+            self._partial_flush_task = asyncio.create_task(self._partial_flush_loop())
+
+    async def _partial_flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._PARTIAL_FLUSH_INTERVAL)
+            payload = self._pending_partial
+            if payload is None:
+                # Idle; exit and let the next partial restart the task.
+                return
+            self._pending_partial = None
+            if self._web_ui:
+                await self._web_ui.broadcast(payload)
+
+    async def _stop_partial_flush(self) -> None:
+        if self._partial_flush_task:
+            self._partial_flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._partial_flush_task
+            self._partial_flush_task = None
+        payload = self._pending_partial
+        self._pending_partial = None
+        if payload and self._web_ui:
+            await self._web_ui.broadcast(payload)
 
     async def _pump_audio(
         self, audio_stream: AudioChunkStream, backend: StreamingTranscriptionBackend
@@ -355,37 +490,36 @@ class TranscriptionPipeline:
             await backend.send_audio_chunk(chunk)
 
     async def _consume_transcripts(self, backend: StreamingTranscriptionBackend) -> None:
+        # Bind hot-loop collaborators to locals once; this loop runs per ASR
+        # result and attribute lookups add up at partial rates.
+        normalize = _normalize_text
+        assembler = self._sentence_assembler
+        state = self.state
+        zoom_publisher = self._zoom_publisher
+        web_ui = self._web_ui
+        emit_sentence = self._emit_sentence
+        broadcast_partial = self._broadcast_partial
+
         async for result in backend.transcript_results():
+            # Backends emit plenty of empty results (silence, keepalives);
+            # skip the normalize call entirely for those.
             if result.is_final:
-                clean_text = _normalize_text(result.text)
-                sentences = self._sentence_assembler.feed(clean_text)
+                clean_text = normalize(result.text) if result.text else ""
+                sentences = assembler.feed(clean_text)
                 if sentences:
                     for sentence in sentences:
-                        await self._emit_sentence(sentence, result.speaker)
-                pending = self._sentence_assembler.pending
-                if self._web_ui:
-                    await self._web_ui.broadcast(
-                        {
-                            "type": "partial",
-                            "text": pending,
-                            "speaker": result.speaker,
-                        }
-                    )
+                        await emit_sentence(sentence, result.speaker)
+                if web_ui:
+                    await broadcast_partial(assembler.pending, result.speaker)
             else:
-                clean_partial = _normalize_text(result.text)
+                clean_partial = normalize(result.text) if result.text else ""
                 if clean_partial:
                     logging.debug("Partial: %s", clean_partial)
-                    if self._web_ui:
-                        await self._web_ui.broadcast(
-                            {
-                                "type": "partial",
-                                "text": clean_partial,
-                                "speaker": result.speaker,
-                            }
-                        )
-                zoom_payload = self.state.add_result(clean_partial, False)
+                    if web_ui:
+                        await broadcast_partial(clean_partial, result.speaker)
+                zoom_payload = state.add_result(clean_partial, False)
                 if zoom_payload:
-                    await self._zoom_publisher.post_caption(zoom_payload)
+                    await zoom_publisher.post_caption(zoom_payload)
 
     async def shutdown(self) -> None:
         """Cancel any running tasks (best-effort)."""
@@ -4,14 +4,18 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import re
 import time
 from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, Optional, Tuple
+from typing import Awaitable, Callable, Dict, Iterable, Optional, Tuple
 
 import aiohttp
 
+# Any Unicode letter; \W\d_ excludes punctuation, digits and underscore.
+_LETTER_RE = re.compile(r"[^\W\d_]")
+
 try:
     from google.auth.transport.requests import Request as GoogleAuthRequest
     from google.oauth2 import service_account
@@ -54,10 +58,16 @@ class TranslationService:
         self.google_credentials_path = Path(google_credentials_path).expanduser() if google_credentials_path else None
         self._timeout = aiohttp.ClientTimeout(total=timeout)
         self._session: Optional[aiohttp.ClientSession] = None
-        self._lock = asyncio.Lock()
         self._cache: "OrderedDict[Tuple[str, Tuple[str, ...], str, str], Tuple[float, Dict[str, str]]]" = OrderedDict()
         self._cache_ttl = max(cache_ttl_seconds, 0.0)
         self._cache_max_size = max(cache_max_size, 1)
+        # targets/provider/source never change after construction; build the
+        # invariant part of the cache key once.
+        self._cache_key_suffix = (
+            tuple(sorted(self.targets)),
+            self.provider,
+            self.source_language,
+        )
         self._google_credentials = None
         self._google_request = None
         if self.provider == "google" and not self.google_api_key:
@@ -82,31 +92,76 @@ class TranslationService:
             await self._session.close()
             self._session = None
 
-    def _cache_key(self, text: str) -> Tuple[str, Tuple[str, ...], str, str]:
-        return (
-            text.strip(),
-            tuple(sorted(self.targets)),
-            self.provider,
-            self.source_language,
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        # Creation has no await gap, so the single-threaded event loop makes
+        # this safe without a lock.
+        if self._session is None or self._session.closed:
+            # One POST per target is unavoidable (neither LibreTranslate
+            # nor Google v2 accepts multiple targets per request), so make
+            # sure the concurrent requests share warm pooled connections
+            # instead of each opening its own.
+            connector = aiohttp.TCPConnector(
+                limit_per_host=max(8, len(self.targets)),
+                ttl_dns_cache=600,
+                keepalive_timeout=60,
+                enable_cleanup_closed=True,
+            )
+            self._session = aiohttp.ClientSession(
+                timeout=self._timeout, connector=connector
+            )
+        return self._session
+
+    async def warmup(self) -> None:
+        """Create the session and pre-warm a connection to the provider.
+
+        Without this the first utterance pays DNS resolution and the TLS
+        handshake before any caption is published.
+        """
+
+        if not self.enabled:
+            return
+        session = self._ensure_session()
+        url = (
+            self.libre_url
+            if self.provider == "libre"
+            else "https://translation.googleapis.com"
         )
+        try:
+            async with session.head(
+                url,
+                allow_redirects=False,
+                timeout=aiohttp.ClientTimeout(total=3),
+            ):
+                pass  # Status is irrelevant; the connection is now pooled.
+        except Exception as exc:  # noqa: BLE001
+            logging.debug("Translation warm-up request failed: %s", exc)
+
+    def _cache_key(self, stripped_text: str) -> Tuple[str, Tuple[str, ...], str, str]:
+        return (stripped_text,) + self._cache_key_suffix
+
+    # Cap on expired entries evicted per lookup so a stale backlog cannot
+    # stall a translate() call.
+    _CACHE_SWEEP_LIMIT = 4
 
     def _get_cached(self, key: Tuple[str, Tuple[str, ...], str, str]) -> Optional[Dict[str, str]]:
         if self._cache_ttl <= 0:
             return None
-        now = time.time()
-        expired_before = now - self._cache_ttl
-        # Remove expired entries lazily.
-        while self._cache and next(iter(self._cache.values()))[0] < expired_before:
-            self._cache.popitem(last=False)
-        cached = self._cache.get(key)
+        cache = self._cache
+        # Monotonic time is immune to NTP/wall-clock jumps.
+        expired_before = time.monotonic() - self._cache_ttl
+        for _ in range(self._CACHE_SWEEP_LIMIT):
+            if not cache or next(iter(cache.values()))[0] >= expired_before:
+                break
+            cache.popitem(last=False)
+        cached = cache.get(key)
         if not cached:
             return None
         timestamp, translations = cached
         if timestamp < expired_before:
-            self._cache.pop(key, None)
+            cache.pop(key, None)
             return None
         # Move to end for LRU behaviour.
-        self._cache.move_to_end(key)
+        cache.move_to_end(key)
         return dict(translations)
 
     def _store_cache(self, key: Tuple[str, Tuple[str, ...], str, str], translations: Dict[str, str]) -> None:
@@ -114,44 +169,75 @@ class TranslationService:
             return
         while len(self._cache) >= self._cache_max_size:
             self._cache.popitem(last=False)
-        self._cache[key] = (time.time(), dict(translations))
+        self._cache[key] = (time.monotonic(), dict(translations))
+
+    async def translate(
+        self,
+        text: str,
+        on_partial: Optional[Callable[[str, str], Awaitable[None]]] = None,
+    ) -> TranslationResult:
+        """Translate ``text`` into all configured targets.
 
-    async def translate(self, text: str) -> TranslationResult:
-        if not self.enabled or not text.strip():
+        ``on_partial`` is awaited with ``(target, translated)`` as each
+        target finishes, so callers can surface fast providers without
+        waiting for the slowest one. Cache hits return without callbacks.
+        """
+
+        if not self.enabled:
+            return TranslationResult(text=text, translations={})
+        stripped = text.strip()
+        if not stripped:
+            return TranslationResult(text=text, translations={})
+        # Punctuation-only or tiny fragments (e.g. a lone "." from a partial)
+        # are not worth a network round trip.
+        if len(stripped) < 3 or _LETTER_RE.search(stripped) is None:
             return TranslationResult(text=text, translations={})
 
         translations: Dict[str, str] = {}
-        key = self._cache_key(text)
+        key = self._cache_key(stripped)
         cached = self._get_cached(key)
         if cached is not None:
             return TranslationResult(text=text, translations=cached)
 
-        async with self._lock:
-            cached = self._get_cached(key)
-            if cached is not None:
-                return TranslationResult(text=text, translations=cached)
+        self._ensure_session()
 
-            if self._session is None or self._session.closed:
-                self._session = aiohttp.ClientSession(timeout=self._timeout)
+        async def run_target(target: str) -> None:
+            try:
+                result = await self._translate_single(text, target)
+            except Exception as exc:  # noqa: BLE001
+                logging.error("Translation to %s failed: %s", target, exc)
+                return
+            if result:
+                translations[target] = result
+                if on_partial:
+                    await on_partial(target, result)
 
-            tasks = [self._translate_single(text, target) for target in self.targets]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            for target, result in zip(self.targets, results):
-                if isinstance(result, Exception):
-                    logging.error("Translation to %s failed: %s", target, result)
-                elif result:
-                    translations[target] = result
-            self._store_cache(key, translations)
+        await asyncio.gather(*(run_target(target) for target in self.targets))
+        self._store_cache(key, translations)
 
         return TranslationResult(text=text, translations=translations)
 
     async def _translate_single(self, text: str, target: str) -> Optional[str]:
         if self.provider == "libre":
-            return await self._translate_libre(text, target)
-        if self.provider == "google":
-            return await self._translate_google(text, target)
-        logging.error("Unknown translation provider: %s", self.provider)
-        return None
+            call = self._translate_libre
+        elif self.provider == "google":
+            call = self._translate_google
+        else:
+            logging.error("Unknown translation provider: %s", self.provider)
+            return None
+        try:
+            return await call(text, target)
+        except aiohttp.ClientConnectionError as exc:
+            # A dropped keepalive connection is transient; the pool discards
+            # the dead socket on its own, so retry once and keep the session
+            # (and its healthy connections and DNS cache) intact.
+            logging.warning(
+                "Translation request to %s hit a connection error (%s); retrying once.",
+                target,
+                exc,
+            )
+            self._ensure_session()
+            return await call(text, target)
 
     async def _translate_libre(self, text: str, target: str) -> Optional[str]:
         assert self._session
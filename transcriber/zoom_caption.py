@@ -3,27 +3,86 @@
 from __future__ import annotations
 
 import asyncio
-import contextlib
+import functools
 import logging
+import random
 from typing import Optional
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
 import aiohttp
+from yarl import URL
 
 from .config import ZoomCaptionConfig
 
 
+@functools.lru_cache(maxsize=64)
+def _encode(text: str) -> bytes:
+    """UTF-8 encode with a small cache for recurring boilerplate captions.
+
+    ASR output repeats fragments like "..." or silence markers often enough
+    that the cache hit skips the encode entirely.
+    """
+
+    return text.encode("utf-8")
+
+
 class ZoomCaptionPublisher:
     """Push transcript updates to Zoom using the Closed Caption API."""
 
+    # Identical for every POST; built once so the flush path does not
+    # allocate and re-validate a headers dict per caption.
+    _HEADERS = {"Content-Type": "text/plain; charset=utf-8"}
+
+    # Zoom ignores these; leaving them out keeps the header block small
+    # enough to coalesce with the body into one packet.
+    _SKIP_AUTO_HEADERS = frozenset({"User-Agent", "Accept-Encoding"})
+
+    # Ceiling for the exponential retry backoff after repeated failures.
+    _BACKOFF_CAP = 30.0
+
     def __init__(self, config: ZoomCaptionConfig) -> None:
         self.config = config
         self._session: Optional[aiohttp.ClientSession] = None
+        # Bound session.post, cached by start() so the per-caption path
+        # skips the attribute/bound-method lookup.
+        self._post = None
+        # Loop reference cached by start(); saves the thread-local lookup
+        # that asyncio.get_running_loop() performs on every token refill.
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # The caption URL never changes after construction and only the seq
+        # parameter varies per post, so parse it once and keep a prefix that
+        # just needs the sequence number appended.
+        self._url_prefix: Optional[str] = None
+        if config.caption_post_url:
+            parsed = urlparse(str(config.caption_post_url))
+            query = parse_qs(parsed.query, keep_blank_values=True)
+            query.pop("seq", None)
+            base_query = urlencode(query, doseq=True)
+            self._url_prefix = urlunparse(
+                parsed._replace(query=f"{base_query}&seq=" if base_query else "seq=")
+            )
         self._sequence = 0
-        self._last_post_monotonic = 0.0
-        self._pending_payload: Optional[str] = None
-        self._post_task: Optional[asyncio.Task] = None
-        self._lock = asyncio.Lock()
+        # Token bucket: a full bucket after idle lets captions go out
+        # immediately while the refill rate caps steady-state QPS.
+        self._tokens = float(config.burst_capacity)
+        self._last_refill = 0.0
+        # Stored pre-encoded: the UTF-8 encode happens at enqueue time and
+        # overlaps with the rate-limit sleep instead of delaying the POST.
+        self._pending_payload: Optional[bytes] = None
+        # Payloads superseded before they were posted; exposed for debugging
+        # how aggressively fast ASR partials are being coalesced.
+        self._dropped_count = 0
+        # Retry backoff after failed posts; cleared by the next 200.
+        self._backoff = 0.0
+        self._consecutive_failures = 0
+        # Hash of the last payload Zoom accepted; stabilized ASR output often
+        # re-submits the identical caption.
+        self._last_sent_hash: Optional[int] = None
+        # One long-lived consumer task posts captions; producers only set the
+        # payload slot and this event, paying no per-caption Task allocation.
+        self._worker: Optional[asyncio.Task] = None
+        self._wake = asyncio.Event()
+        self._stopping = False
 
     async def __aenter__(self) -> "ZoomCaptionPublisher":
         await self.start()
@@ -39,19 +98,42 @@ class ZoomCaptionPublisher:
         if not self.config.caption_post_url:
             logging.warning("Zoom caption URL not configured; captions will not be sent.")
             return
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
         if self._session is None:
             timeout = aiohttp.ClientTimeout(total=10)
-            self._session = aiohttp.ClientSession(timeout=timeout)
+            # Captions go to exactly one Zoom endpoint; a single kept-alive
+            # TLS connection avoids a handshake per caption near the
+            # rate-limit interval.
+            connector = aiohttp.TCPConnector(
+                limit=1,
+                limit_per_host=1,
+                keepalive_timeout=75,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True,
+            )
+            self._session = aiohttp.ClientSession(timeout=timeout, connector=connector)
+            self._post = self._session.post
+        if self._worker is None or self._worker.done():
+            self._worker = self._loop.create_task(self._run())
 
     async def close(self) -> None:
+        self._stopping = True
+        if self._worker:
+            self._wake.set()
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
         if self._session:
             await self._session.close()
+            # Give the loop one tick so the SSL close handshake flushes
+            # before the transport is dropped (per aiohttp docs).
+            await asyncio.sleep(0)
             self._session = None
-        if self._post_task:
-            self._post_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await self._post_task
-            self._post_task = None
+            self._post = None
 
     async def post_caption(self, text: str) -> None:
         """Post a caption update, respecting rate limits and sequence numbers."""
@@ -59,24 +141,20 @@ class ZoomCaptionPublisher:
         if not self.config.enabled or not self.config.caption_post_url:
             return
 
-        if not text.strip():
+        stripped = text.strip()
+        if not stripped:
             logging.debug("Skipping empty caption payload.")
             return
 
-        async with self._lock:
-            self._pending_payload = text.strip()
-            if not await self._ensure_session():
-                return
-            await self._schedule_flush_locked()
-
-    def _build_url_with_sequence(self, sequence: int) -> str:
-        base_url = str(self.config.caption_post_url)
-        parsed = urlparse(base_url)
-        query = parse_qs(parsed.query, keep_blank_values=True)
-        query["seq"] = [str(sequence)]
-        new_query = urlencode(query, doseq=True)
-        updated = parsed._replace(query=new_query)
-        return urlunparse(updated)
+        encoded = _encode(stripped)
+        # All mutation happens on the event-loop thread with no await between
+        # the statements, so no lock is needed around the single payload slot.
+        if self._pending_payload is not None:
+            self._dropped_count += 1
+        self._pending_payload = encoded
+        if not await self._ensure_session():
+            return
+        self._wake.set()
 
     async def _ensure_session(self) -> bool:
         if self._session is None:
@@ -86,55 +164,109 @@ class ZoomCaptionPublisher:
             return False
         return True
 
-    async def _schedule_flush_locked(self) -> None:
-        if self._post_task and not self._post_task.done():
-            return
-        now = asyncio.get_running_loop().time()
-        elapsed = now - self._last_post_monotonic
-        delay = max(self.config.min_post_interval_seconds - elapsed, 0.0)
-        self._post_task = asyncio.create_task(self._flush_pending(delay))
+    def _acquire_token(self) -> float:
+        """Take one token, returning how long to wait before posting."""
 
-    async def _flush_pending(self, delay: float) -> None:
-        try:
-            if delay > 0:
-                await asyncio.sleep(delay)
-            async with self._lock:
+        now = self._loop.time()
+        rate = 1.0 / self.config.min_post_interval_seconds
+        self._tokens = min(
+            float(self.config.burst_capacity),
+            self._tokens + rate * (now - self._last_refill),
+        )
+        self._last_refill = now
+        # Tokens may go negative (debt): the deficit is repaid by the refill
+        # that accrues while the delayed post waits, keeping consecutive
+        # delayed posts spaced a full interval apart.
+        self._tokens -= 1.0
+        if self._tokens >= 0.0:
+            return 0.0
+        return -self._tokens / rate
+
+    def _register_failure(self, retry_after: Optional[str] = None) -> None:
+        base = self.config.min_post_interval_seconds
+        self._consecutive_failures += 1
+        self._backoff = min(
+            self._BACKOFF_CAP, base * (2 ** self._consecutive_failures)
+        ) + random.uniform(0.0, base)
+        if retry_after:
+            try:
+                self._backoff = max(self._backoff, float(retry_after))
+            except ValueError:
+                pass
+
+    def _requeue(self, payload: bytes) -> None:
+        """Put a failed payload back for a later attempt.
+
+        A caption that arrived while the POST was in flight is newer than
+        the failed one, so it wins the pending slot.
+        """
+
+        if self._pending_payload is None:
+            self._pending_payload = payload
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            await self._wake.wait()
+            self._wake.clear()
+            # Drain until the slot stays empty; failures re-queue and loop
+            # again with the backoff folded into the delay.
+            while self._pending_payload is not None and not self._stopping:
+                delay = max(self._acquire_token(), self._backoff)
+                if delay > 1e-3:
+                    await asyncio.sleep(delay)
+                elif delay > 0.0:
+                    # Sub-millisecond residue from clock skew: a bare yield
+                    # avoids arming and tearing down a timer handle.
+                    await asyncio.sleep(0)
                 payload = self._pending_payload
                 self._pending_payload = None
-                self._post_task = None
-            if not payload:
-                return
-            if not await self._ensure_session():
-                async with self._lock:
-                    self._pending_payload = payload
-                    await self._schedule_flush_locked()
-                return
-            url = self._build_url_with_sequence(self._sequence)
-            self._sequence += 1
-            try:
-                async with self._session.post(
-                    url,
-                    data=payload.encode("utf-8"),
-                    headers={"Content-Type": "text/plain; charset=utf-8"},
-                ) as response:
-                    if response.status != 200:
-                        body = await response.text()
-                        logging.error(
-                            "Zoom caption POST failed: status=%s body=%s", response.status, body
-                        )
-                        async with self._lock:
-                            # Re-queue for a later attempt
-                            self._pending_payload = payload
-                            await self._schedule_flush_locked()
-                        return
-                    logging.debug("Caption posted to Zoom (seq=%s).", self._sequence - 1)
-                    self._last_post_monotonic = asyncio.get_running_loop().time()
-            except Exception as exc:  # pylint: disable=broad-except
-                logging.exception("Failed to post caption to Zoom: %s", exc)
-                async with self._lock:
-                    self._pending_payload = payload
-                    await self._schedule_flush_locked()
-        except asyncio.CancelledError:
-            raise
+                if not payload:
+                    break
+                try:
+                    await self._post_once(payload)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:  # pylint: disable=broad-except
+                    logging.exception("Unexpected error in Zoom caption flush: %s", exc)
+
+    async def _post_once(self, payload: bytes) -> None:
+        payload_hash = hash(payload)
+        if payload_hash == self._last_sent_hash:
+            # Identical to what Zoom already shows; save the round trip
+            # and the rate-limit slot.
+            logging.debug("Skipping duplicate caption payload.")
+            return
+        if not await self._ensure_session():
+            self._requeue(payload)
+            return
+        # encoded=True: the prefix came out of urlencode already quoted, so
+        # this skips yarl's re-encoding here and aiohttp's URL parse inside
+        # session.post.
+        url = URL(f"{self._url_prefix}{self._sequence}", encoded=True)
+        self._sequence += 1
+        try:
+            async with self._post(
+                url,
+                data=payload,
+                headers={**self._HEADERS, "Content-Length": str(len(payload))},
+                skip_auto_headers=self._SKIP_AUTO_HEADERS,
+            ) as response:
+                if response.status != 200:
+                    # Zoom error pages can be large HTML; cap the read so
+                    # the log line never buffers an unbounded body.
+                    raw = await response.content.read(2048)
+                    body = raw.decode("utf-8", "replace")
+                    logging.error(
+                        "Zoom caption POST failed: status=%s body=%s", response.status, body
+                    )
+                    self._register_failure(response.headers.get("Retry-After"))
+                    self._requeue(payload)
+                    return
+                logging.debug("Caption posted to Zoom (seq=%s).", self._sequence - 1)
+                self._backoff = 0.0
+                self._consecutive_failures = 0
+                self._last_sent_hash = payload_hash
         except Exception as exc:  # pylint: disable=broad-except
-            logging.exception("Unexpected error in Zoom caption flush: %s", exc)
+            logging.exception("Failed to post caption to Zoom: %s", exc)
+            self._register_failure()
+            self._requeue(payload)
@@ -277,6 +277,18 @@
     applyAllVisibility();
   }
 
+  function updateHistoryTranslations(speaker, text, translations) {
+    // Translations arrive after the final text; refresh the newest history
+    // row if it still corresponds to the same utterance.
+    const newest = historyEl.firstChild;
+    if (!newest) return;
+    const original = newest.querySelector('.history-original');
+    if (!original || !original.textContent.endsWith(`${speaker}${text}`)) return;
+    historyEl.removeChild(newest);
+    historyEntries.pop();
+    appendToHistory(speaker, text, translations);
+  }
+
   function trimHistory() {
     while (historyEntries.length > MAX_HISTORY) {
       historyEntries.shift();
@@ -321,6 +333,8 @@
     const protocol = location.protocol === 'https:' ? 'wss' : 'ws';
     const wsUrl = `${protocol}://${location.host}/ws`;
     const ws = new WebSocket(wsUrl);
+    ws.binaryType = 'arraybuffer';
+    const decoder = new TextDecoder();
 
     ws.onopen = () => console.log('[WS] connected');
     ws.onclose = () => {
@@ -329,7 +343,8 @@
     };
     ws.onmessage = (event) => {
       try {
-        const msg = JSON.parse(event.data);
+        const raw = typeof event.data === 'string' ? event.data : decoder.decode(event.data);
+        const msg = JSON.parse(raw);
         const speakerPrefix = msg.speaker ? `[${msg.speaker}] ` : '';
         if (msg.type === 'partial') {
           if (showPartialEl.checked) {
@@ -343,6 +358,12 @@
             appendToHistory(speakerPrefix, text, msg.translations || {});
           }
           partialEl.textContent = '';
+        } else if (msg.type === 'translation_update') {
+          const text = (msg.text || '').trim();
+          renderFinalTranslations(msg.translations || {});
+          if (text) {
+            updateHistoryTranslations(speakerPrefix, text, msg.translations || {});
+          }
         }
       } catch (err) {
         console.warn('Invalid WS payload', err);